@@ -13,28 +13,270 @@ Supports deployment of any app from the shcluster/apps/ directory with:
 
 import os
 import sys
-import platform
+import atexit
 import shutil
-import subprocess
-import tarfile
-import json
+import stat
 import re
-import argparse
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-import configparser
+from typing import List, Dict, Optional, Tuple, Union
 
 
-class Colors:
-    """ANSI color codes for terminal output"""
-    RED = '\033[0;31m'
-    GREEN = '\033[0;32m'
-    YELLOW = '\033[1;33m'
-    BLUE = '\033[0;34m'
-    CYAN = '\033[0;36m'
-    BOLD = '\033[1m'
-    NC = '\033[0m'  # No Color
+# Stanza headers of a .conf file (the line ending is left out of the match)
+_CONF_SECTION_RE = re.compile(rb'(?m)^[ \t]*\[([^\]\r\n]+)\][ \t]*(?=\r?$)')
+
+# Single key = value lines of a .conf file; group 1 is everything before the value, group 2 the value
+_CONF_VERSION_LINE_RE = re.compile(rb'(?mi)^([ \t]*version[ \t]*=[ \t]*)([^\r\n]*)')
+_CONF_BUILD_LINE_RE = re.compile(rb'(?mi)^([ \t]*build[ \t]*=[ \t]*)([^\r\n]*)')
+_CONF_LABEL_LINE_RE = re.compile(rb'(?mi)^([ \t]*label[ \t]*=[ \t]*)([^\r\n]*)')
+
+# Version suffixes stripped from an app label before the new version is appended
+_LABEL_VER_RE = re.compile(rb'\s+v\d+\.\d+\.\d+.*$')
+_LABEL_PAREN_RE = re.compile(rb'\s*\([^)]*\)$')
+
+# Accepted format for a new app version
+_SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+$')
+
+# App numbers in the interactive selection
+_SELECTION_NUM_RE = re.compile(r'\d+')
+
+# I/O buffer used for backup archives (tarfile defaults to 16 KiB)
+_BACKUP_BUFSIZE = 2 * 1024 * 1024
+
+# Minimum bytes requested per sendfile() call, and the buffer size when sendfile() is unusable
+_COPY_CHUNK = 1024 * 1024
+
+# Files copied at once per app with --remote-target, to overlap network filesystem round trips
+_REMOTE_COPY_WORKERS = 8
+
+# Files deployed with the executable bit set
+_EXE_EXTS = frozenset({'.py', '.sh'})
+
+# sendfile() between two regular files is only supported on Linux
+_USE_SENDFILE = sys.platform.startswith('linux') and hasattr(os, 'sendfile')
+
+# posix_fadvise() is used to warm the page cache while waiting on prompts (not on Windows/macOS)
+_USE_FADVISE = hasattr(os, 'posix_fadvise')
+
+# Versions read from app.conf files, kept between runs and keyed by path, mtime and size
+_VERSION_CACHE_FILE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'splunk_app_deployer', 'versions.json'
+)
+
+# Files and directories Splunk never reads at runtime, left out of deployments
+_IGNORE = shutil.ignore_patterns('*.md', '*.pyc', '__pycache__', '.git', '.gitignore',
+                                 'tests', 'test', '*.egg-info', '.DS_Store')
+
+
+def _get_conf_option(data: bytes, section: bytes, line_re) -> Optional[bytes]:
+    """Value of a key in [section] of raw .conf contents, or None if it is not set"""
+    headers = list(_CONF_SECTION_RE.finditer(data))
+    
+    for i, header in enumerate(headers):
+        if header.group(1).strip() != section:
+            continue
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(data)
+        m = line_re.search(data, header.end(), end)
+        if m:
+            return m.group(2).strip()
+    
+    return None
+
+
+def _set_conf_option(data: bytes, section: bytes, line_re, key: bytes, value: bytes) -> bytes:
+    """Set key = value in [section] of raw .conf contents, leaving all other lines untouched"""
+    newline = b'\r\n' if b'\r\n' in data else b'\n'
+    headers = list(_CONF_SECTION_RE.finditer(data))
+    
+    for i, header in enumerate(headers):
+        if header.group(1).strip() != section:
+            continue
+        start = header.end()
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(data)
+        body, count = line_re.subn(lambda m: m.group(1) + value, data[start:end], count=1)
+        if not count:
+            # Add the key directly below the stanza header
+            body = newline + key + b' = ' + value + body
+        return data[:start] + body + data[end:]
+    
+    # Stanza does not exist yet, append it
+    if data:
+        data += newline if data.endswith(b'\n') else newline * 2
+    return data + b'[' + section + b']' + newline + key + b' = ' + value + newline
+
+
+def _sendfile_all(src_fd: int, dst_fd: int, size: int):
+    """Copy the contents of src_fd to dst_fd in the kernel, asking for the whole file per call"""
+    offset = 0
+    try:
+        while True:
+            sent = os.sendfile(dst_fd, src_fd, offset, max(size - offset, _COPY_CHUNK))
+            if not sent:
+                break
+            offset += sent
+    except OSError:
+        # Some filesystems refuse sendfile(), finish the copy in user space
+        os.lseek(src_fd, offset, os.SEEK_SET)
+        os.lseek(dst_fd, offset, os.SEEK_SET)
+        with open(src_fd, 'rb', closefd=False) as fsrc, open(dst_fd, 'wb', closefd=False) as fdst:
+            shutil.copyfileobj(fsrc, fdst, _COPY_CHUNK)
+
+
+def _copy_file(src: str, dst: str, mode: Optional[int] = None):
+    """Copy a single file, applying `mode` or else preserving the source mode"""
+    if not _USE_SENDFILE:
+        shutil.copy2(src, dst)
+        if mode is not None:
+            os.chmod(dst, mode)
+        return
+    
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        st = os.fstat(src_fd)
+        if mode is None:
+            mode = stat.S_IMODE(st.st_mode)
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            if st.st_size:
+                _sendfile_all(src_fd, dst_fd, st.st_size)
+            os.fchmod(dst_fd, mode)
+            # Keep mtimes like shutil.copy2 so _tree_fingerprint can match copies
+            os.utime(dst_fd, ns=(st.st_atime_ns, st.st_mtime_ns))
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _place_file(src: str, dst: str, set_permissions: bool, hardlink: bool, copied: Optional[set]):
+    """Link or copy one file for _fast_copytree"""
+    if hardlink:
+        try:
+            os.link(src, dst)
+        except OSError:
+            hardlink = False
+    if not hardlink:
+        mode = None
+        if set_permissions:
+            mode = 0o755 if os.path.splitext(dst)[1] in _EXE_EXTS else 0o644
+        _copy_file(src, dst, mode)
+    if copied is not None:
+        copied.add(dst)
+
+
+def _fast_copytree(src: str, dst: str, set_permissions: bool = False, hardlink: bool = False,
+                   ignore=None, copied: Optional[set] = None, executor=None):
+    """Recursively copy src to dst in a single pass
+    
+    Files are copied with sendfile() where the platform supports it. With
+    set_permissions, directories and .py/.sh files get 0755 and all other
+    files 0644 as they are created, otherwise source modes are preserved.
+    With hardlink, files are linked to the source instead of copied (keeping
+    the source's mode), falling back to a copy when linking fails. `ignore`
+    works like the argument of the same name to shutil.copytree. The path of
+    every file written is added to `copied` when it is given. With an
+    executor, files are copied on its threads while the walk continues.
+    """
+    pending = [] if executor is not None else None
+    _copytree_walk(src, dst, set_permissions, hardlink, ignore, copied, executor, pending)
+    
+    # Re-raise the first failed copy, like the serial walk would
+    for future in pending or ():
+        future.result()
+
+
+def _copytree_walk(src: str, dst: str, set_permissions: bool, hardlink: bool, ignore,
+                   copied: Optional[set], executor, pending: Optional[list]):
+    """Create the directories below src in dst and place (or queue) every file"""
+    os.makedirs(dst)
+    if set_permissions:
+        os.chmod(dst, 0o755)
+    
+    with os.scandir(src) as it:
+        entries = list(it)
+    ignored = ignore(src, [entry.name for entry in entries]) if ignore else ()
+    
+    for entry in entries:
+        if entry.name in ignored:
+            continue
+        target = os.path.join(dst, entry.name)
+        if entry.is_dir():
+            _copytree_walk(entry.path, target, set_permissions, hardlink, ignore, copied, executor, pending)
+        elif executor is not None:
+            pending.append(executor.submit(_place_file, entry.path, target, set_permissions, hardlink, copied))
+        else:
+            _place_file(entry.path, target, set_permissions, hardlink, copied)
+
+
+def _prefetch_tree(root: str, ignore=None):
+    """Ask the kernel to start reading every file below root into the page cache (best effort)"""
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    ignored = ignore(root, [entry.name for entry in entries]) if ignore else ()
+    
+    for entry in entries:
+        if entry.name in ignored:
+            continue
+        if entry.is_dir():
+            _prefetch_tree(entry.path, ignore)
+            continue
+        try:
+            fd = os.open(entry.path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _tree_fingerprint(root: str, ignore=None) -> bytes:
+    """Digest of the relative path, size and mtime of everything below root"""
+    import hashlib
+    
+    digest = hashlib.blake2b(digest_size=16)
+    
+    def walk(path: str, prefix: bytes):
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        ignored = ignore(path, [entry.name for entry in entries]) if ignore else ()
+        for entry in entries:
+            if entry.name in ignored:
+                continue
+            rel_path = prefix + os.fsencode(entry.name)
+            if entry.is_dir():
+                digest.update(b'd:' + rel_path + b'\0')
+                walk(entry.path, rel_path + b'/')
+            else:
+                st = entry.stat()
+                digest.update(b'f:%s:%d:%d\0' % (rel_path, st.st_size, st.st_mtime_ns))
+    
+    walk(root, b'')
+    return digest.digest()
+
+
+# ANSI color codes for terminal output. Escape codes are only useful on a
+# terminal, so they are all empty otherwise; also honour https://no-color.org
+_USE_COLOR = sys.stdout is not None and sys.stdout.isatty() and os.environ.get('NO_COLOR') is None
+RED = '\033[0;31m' if _USE_COLOR else ''
+GREEN = '\033[0;32m' if _USE_COLOR else ''
+YELLOW = '\033[1;33m' if _USE_COLOR else ''
+BLUE = '\033[0;34m' if _USE_COLOR else ''
+CYAN = '\033[0;36m' if _USE_COLOR else ''
+BOLD = '\033[1m' if _USE_COLOR else ''
+NC = '\033[0m' if _USE_COLOR else ''  # No Color
+
+# Per-app output lines, formatted once the color codes above are settled
+_APP_MENU_TMPL = f"  {CYAN}{{num:2d}}){NC} {{app:<25}} {YELLOW}(v{{v}}){NC}"
+_APP_LINE_TMPL = f"  • {CYAN}{{app}}{NC} {YELLOW}(v{{v}}){NC}"
 
 
 class DeploymentLogger:
@@ -42,36 +284,58 @@ class DeploymentLogger:
     
     def __init__(self, log_file: Path):
         self.log_file = log_file
-        log_file.parent.mkdir(parents=True, exist_ok=True)
+        if not log_file.parent.is_dir():
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(log_file, 'a', encoding='utf-8', buffering=64 * 1024)
+        self._lock = threading.Lock()
+        self._cached_sec = None
+        self._cached_timestamp = ''
+        atexit.register(self.close)
     
-    def _write_log(self, level: str, message: str, color: str = ""):
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_entry = f"[{timestamp}] {message}"
-        
-        # Print to console with color
-        print(f"{color}{log_entry}{Colors.NC}")
-        
-        # Write to file without color
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(f"{log_entry}\n")
+    def _timestamp(self) -> str:
+        """Current local time, formatted at most once per second"""
+        now = int(time.time())
+        if now != self._cached_sec:
+            self._cached_timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+            self._cached_sec = now
+        return self._cached_timestamp
+    
+    def _write_log(self, level: str, message: str, color: str = "", flush: bool = False):
+        # Apps may be deployed concurrently, so keep each entry intact
+        with self._lock:
+            log_entry = f"[{self._timestamp()}] {message}"
+            
+            # Print to console with color
+            print(f"{color}{log_entry}{NC}")
+            
+            # Write to file without color
+            self._fh.write(f"{log_entry}\n")
+            if flush:
+                self._fh.flush()
+    
+    def close(self):
+        """Flush and close the log file"""
+        if not self._fh.closed:
+            self._fh.close()
     
     def log(self, message: str):
-        self._write_log("INFO", message, Colors.BLUE)
+        self._write_log("INFO", message, BLUE)
     
     def success(self, message: str):
-        self._write_log("SUCCESS", f"✅ {message}", Colors.GREEN)
+        self._write_log("SUCCESS", f"✅ {message}", GREEN, flush=True)
     
     def warning(self, message: str):
-        self._write_log("WARNING", f"⚠️  {message}", Colors.YELLOW)
+        self._write_log("WARNING", f"⚠️  {message}", YELLOW)
     
     def error(self, message: str):
-        self._write_log("ERROR", f"❌ {message}", Colors.RED)
+        self._write_log("ERROR", f"❌ {message}", RED, flush=True)
     
     def info(self, message: str):
-        self._write_log("INFO", f"ℹ️  {message}", Colors.CYAN)
+        self._write_log("INFO", f"ℹ️  {message}", CYAN)
     
     def bold(self, message: str):
-        print(f"{Colors.BOLD}{message}{Colors.NC}")
+        with self._lock:
+            print(f"{BOLD}{message}{NC}")
 
 
 class OSConfig:
@@ -83,6 +347,8 @@ class OSConfig:
     
     def _detect_os(self) -> str:
         """Detect the operating system"""
+        import platform
+        
         system = platform.system().lower()
         if system == 'linux':
             return 'Linux'
@@ -120,68 +386,188 @@ class SplunkAppManager:
     def __init__(self, apps_source_dir: Path, logger: DeploymentLogger):
         self.apps_source_dir = apps_source_dir
         self.logger = logger
+        self._app_meta = {}
+        self._apps_index = {}
+        self._version_cache = {}
+        self._version_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._saved_versions = None
+        self._saved_versions_dirty = False
+        self._seen_conf_paths = set()
+        atexit.register(self.save_version_cache)
     
-    def list_available_apps(self) -> List[str]:
-        """List all valid Splunk apps in the source directory"""
+    def list_available_apps(self) -> List[Tuple[str, Dict[str, bool]]]:
+        """List all valid Splunk apps in the source directory with their structure flags"""
         apps = []
+        self._app_meta = {}
+        self._apps_index = {}
         
         if not self.apps_source_dir.exists():
             return apps
         
-        for app_path in self.apps_source_dir.iterdir():
-            if app_path.is_dir():
-                app_conf_path = app_path / 'default' / 'app.conf'
-                if app_conf_path.exists():
-                    apps.append(app_path.name)
-        
-        return sorted(apps)
+        # DirEntry.is_dir() is answered from the directory read itself; symlinked app dirs are followed
+        with os.scandir(self.apps_source_dir) as it:
+            for entry in it:
+                if entry.is_dir():
+                    meta = self._scan_app_structure(entry.path)
+                    if meta['app_conf_exists']:
+                        apps.append((entry.name, meta))
+                        self._app_meta[entry.name] = meta
+                        self._apps_index[entry.name] = entry
+                        self._seen_conf_paths.add(os.path.abspath(os.path.join(entry.path, 'default', 'app.conf')))
+        
+        return sorted(apps, key=lambda app: app[0])
+    
+    def get_app_path(self, app_name: str) -> str:
+        """Source directory of an app, reusing the DirEntry from the listing scan"""
+        entry = self._apps_index.get(app_name)
+        if entry is not None:
+            return entry.path
+        return os.path.join(str(self.apps_source_dir), app_name)
+    
+    def _scan_app_structure(self, app_path: str) -> Dict[str, bool]:
+        """Record which of the required app directories and files exist"""
+        try:
+            with os.scandir(app_path) as it:
+                dirs = {entry.name for entry in it if entry.is_dir()}
+        except FileNotFoundError:
+            dirs = set()
+        
+        default_exists = 'default' in dirs
+        metadata_exists = 'metadata' in dirs
+        return {
+            'default_exists': default_exists,
+            'metadata_exists': metadata_exists,
+            'app_conf_exists': default_exists and os.path.isfile(os.path.join(app_path, 'default', 'app.conf')),
+            'default_meta_exists': metadata_exists and os.path.isfile(os.path.join(app_path, 'metadata', 'default.meta')),
+        }
     
     def get_current_version(self, app_name: str) -> str:
-        """Get the current version from app.conf"""
-        app_conf_path = self.apps_source_dir / app_name / 'default' / 'app.conf'
-        
-        if not app_conf_path.exists():
-            return "1.0.0"
+        """Get the current version from app.conf (read once per app per run)"""
+        if app_name not in self._version_cache:
+            self._remember_version(app_name, self._read_current_version(app_name))
+        return self._version_cache[app_name]
+    
+    def _remember_version(self, app_name: str, version: str):
+        """Record an app's current version (apps may be processed concurrently)"""
+        with self._version_lock:
+            self._version_cache[app_name] = version
+    
+    def _read_current_version(self, app_name: str) -> str:
+        """Read the current version from app.conf, or from the version cache if it is unchanged"""
+        app_conf_path = os.path.join(self.get_app_path(app_name), 'default', 'app.conf')
         
         try:
-            config = configparser.ConfigParser()
-            config.read(app_conf_path)
+            st = os.stat(app_conf_path)
+            saved = self._load_version_cache().get(os.path.abspath(app_conf_path))
+            if (isinstance(saved, list) and len(saved) == 3 and isinstance(saved[2], str)
+                    and saved[:2] == [st.st_mtime_ns, st.st_size]):
+                return saved[2]
             
-            # Try launcher section first, then install section
-            for section in ['launcher', 'install']:
-                if config.has_section(section) and config.has_option(section, 'version'):
-                    return config.get(section, 'version').strip('"')
-            
-            return "1.0.0"
+            with open(app_conf_path, 'rb') as f:
+                data = f.read()
+                st = os.fstat(f.fileno())
         except Exception:
             return "1.0.0"
+        
+        # Try launcher section first, then install section
+        version = "1.0.0"
+        for section in [b'launcher', b'install']:
+            value = _get_conf_option(data, section, _CONF_VERSION_LINE_RE)
+            if value is not None:
+                version = value.decode('utf-8', 'replace').strip('"')
+                break
+        
+        self._store_saved_version(app_conf_path, st, version)
+        return version
+    
+    def _store_saved_version(self, app_conf_path: str, st: os.stat_result, version: str):
+        """Record the version of an app.conf in the on-disk version cache, keyed on its absolute path"""
+        cache_key = os.path.abspath(app_conf_path)
+        saved = self._load_version_cache()
+        with self._version_lock:
+            saved[cache_key] = [st.st_mtime_ns, st.st_size, version]
+            self._saved_versions_dirty = True
+            self._seen_conf_paths.add(cache_key)
+    
+    def _load_version_cache(self) -> Dict[str, list]:
+        """Load the on-disk version cache on first use (a missing or corrupt file is an empty cache)"""
+        import json
+        
+        with self._version_lock:
+            if self._saved_versions is None:
+                try:
+                    with open(_VERSION_CACHE_FILE, 'r', encoding='utf-8') as f:
+                        saved = json.load(f)
+                    if not isinstance(saved, dict):
+                        saved = {}
+                except (OSError, ValueError):
+                    saved = {}
+                self._saved_versions = saved
+            return self._saved_versions
+    
+    def save_version_cache(self):
+        """Atomically rewrite the on-disk version cache if it changed (best effort)
+        
+        Only apps seen in this run are kept, so the file does not grow with
+        every source tree or app that ever existed.
+        """
+        if self._saved_versions is None:
+            return
+        with self._version_lock:
+            kept = {path: entry for path, entry in self._saved_versions.items()
+                    if path in self._seen_conf_paths}
+            if len(kept) != len(self._saved_versions):
+                self._saved_versions = kept
+                self._saved_versions_dirty = True
+        if not self._saved_versions_dirty:
+            return
+        import json
+        
+        tmp_path = f"{_VERSION_CACHE_FILE}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(_VERSION_CACHE_FILE), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._saved_versions, f)
+            os.replace(tmp_path, _VERSION_CACHE_FILE)
+            self._saved_versions_dirty = False
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
     
     def validate_app_structure(self, app_name: str) -> bool:
         """Validate that the app has required structure"""
-        app_dir = self.apps_source_dir / app_name
+        base = self.get_app_path(app_name)
         
         self.logger.log(f"Validating {app_name} app structure...")
         
-        # Check required directories
-        required_dirs = ['default', 'metadata']
-        for dir_name in required_dirs:
-            if not (app_dir / dir_name).exists():
-                self.logger.error(f"Missing required directory: {app_dir / dir_name}")
-                return False
-        
-        # Check required files
-        required_files = ['default/app.conf', 'metadata/default.meta']
-        for file_path in required_files:
-            if not (app_dir / file_path).exists():
-                self.logger.error(f"Missing required file: {app_dir / file_path}")
-                return False
+        # Reuse the structure recorded by list_available_apps when available
+        meta = self._app_meta.get(app_name) or self._scan_app_structure(base)
+        
+        # A missing directory implies its file is missing too, so report only the directory
+        missing = []
+        required = [
+            ('default', 'default_exists', 'app.conf', 'app_conf_exists'),
+            ('metadata', 'metadata_exists', 'default.meta', 'default_meta_exists'),
+        ]
+        for dir_name, dir_flag, file_name, file_flag in required:
+            if not meta[dir_flag]:
+                missing.append(f"directory {os.path.join(base, dir_name)}")
+            elif not meta[file_flag]:
+                missing.append(f"file {os.path.join(base, dir_name, file_name)}")
+        
+        if missing:
+            self.logger.error(f"Missing required {', '.join(missing)}")
+            return False
         
         self.logger.success(f"{app_name} app structure validation passed")
         return True
     
     def update_app_version(self, app_name: str, version: str) -> bool:
         """Update the version in app.conf"""
-        app_conf_path = self.apps_source_dir / app_name / 'default' / 'app.conf'
+        app_conf_path = Path(self.get_app_path(app_name), 'default', 'app.conf')
         
         if not app_conf_path.exists():
             self.logger.error(f"App configuration file not found: {app_conf_path}")
@@ -190,32 +576,43 @@ class SplunkAppManager:
         self.logger.log(f"Updating {app_name} version to {version}...")
         
         try:
-            # Read the file
-            config = configparser.ConfigParser()
-            config.read(app_conf_path)
-            
-            # Update version in launcher section
-            if not config.has_section('launcher'):
-                config.add_section('launcher')
-            config.set('launcher', 'version', version)
-            
-            # Update build number
             build_num = datetime.now().strftime('%Y%m%d%H%M')
-            if not config.has_section('install'):
-                config.add_section('install')
-            config.set('install', 'build', build_num)
-            
-            # Update label to include version if it exists
-            if config.has_option('launcher', 'label'):
-                current_label = config.get('launcher', 'label')
-                # Remove existing version info
-                base_label = re.sub(r'\s+v\d+\.\d+\.\d+.*$', '', current_label)
-                base_label = re.sub(r'\s*\([^)]*\)$', '', base_label).strip()
-                config.set('launcher', 'label', f"{base_label} v{version}")
             
-            # Write back to file
-            with open(app_conf_path, 'w') as f:
-                config.write(f)
+            # One writer at a time when deploying concurrently
+            with self._write_lock:
+                original = data = app_conf_path.read_bytes()
+                current_label = _get_conf_option(data, b'launcher', _CONF_LABEL_LINE_RE)
+                
+                # Update version in launcher section
+                data = _set_conf_option(data, b'launcher', _CONF_VERSION_LINE_RE,
+                                        b'version', version.encode())
+                
+                # Update build number
+                data = _set_conf_option(data, b'install', _CONF_BUILD_LINE_RE,
+                                        b'build', build_num.encode())
+                
+                # Update label to include version if it exists
+                if current_label is not None:
+                    # Remove existing version info (on the raw bytes, so any encoding survives)
+                    base_label = _LABEL_VER_RE.sub(b'', current_label)
+                    base_label = _LABEL_PAREN_RE.sub(b'', base_label).strip()
+                    data = _set_conf_option(data, b'launcher', _CONF_LABEL_LINE_RE,
+                                            b'label', base_label + b' v' + version.encode())
+                
+                # Leave the file (and its mtime) alone when nothing actually changed
+                if data == original:
+                    self._remember_version(app_name, version)
+                    self.logger.info(f"{app_name} version already current, app.conf unchanged")
+                    return True
+                
+                # Write to a temporary file and swap it in so readers never see a partial file
+                tmp_path = app_conf_path.with_name(app_conf_path.name + '.tmp')
+                tmp_path.write_bytes(data)
+                shutil.copymode(str(app_conf_path), str(tmp_path))
+                os.replace(str(tmp_path), str(app_conf_path))
+                self._remember_version(app_name, version)
+                self._store_saved_version(os.path.join(self.get_app_path(app_name), 'default', 'app.conf'),
+                                          os.stat(str(app_conf_path)), version)
             
             self.logger.success(f"{app_name} version updated to {version}")
             return True
@@ -228,10 +625,20 @@ class SplunkAppManager:
 class DeploymentManager:
     """Main deployment management class"""
     
-    def __init__(self, apps_source_dir: Optional[Path] = None):
+    def __init__(self, apps_source_dir: Optional[Path] = None, compress_backups: bool = False,
+                 hardlink: bool = False, include_docs: bool = False, remote_target: bool = False,
+                 link_backups: bool = False):
         self.script_dir = Path(__file__).parent
         # Default to looking for apps in current directory structure
         self.apps_source_dir = apps_source_dir or Path.cwd() / 'apps'
+        self.compress_backups = compress_backups
+        self.link_backups = link_backups
+        self.hardlink = hardlink
+        self.remote_target = remote_target
+        # Files matching _IGNORE are only deployed when explicitly asked for
+        self.copy_ignore = None if include_docs else _IGNORE
+        self._git_available = None
+        self._env_ok = None
         self.deployment_log_dir = self.script_dir / 'logs'
         self.backup_dir = self.script_dir / 'backups'
         
@@ -242,14 +649,27 @@ class DeploymentManager:
         self.os_config = OSConfig()
         self.app_manager = SplunkAppManager(self.apps_source_dir, self.logger)
         
-        # Create necessary directories
-        self.deployment_log_dir.mkdir(parents=True, exist_ok=True)
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        # Create necessary directories (the log directory is created by DeploymentLogger)
+        if not self.backup_dir.is_dir():
+            self.backup_dir.mkdir(parents=True, exist_ok=True)
         
         self.logger.log(f"Detected operating system: {self.os_config.os_type}")
     
+    @property
+    def git_available(self) -> bool:
+        """Whether a git executable is on PATH (looked up once per run)"""
+        if self._git_available is None:
+            self._git_available = shutil.which('git') is not None
+        return self._git_available
+    
     def validate_environment(self) -> bool:
-        """Validate the deployment environment"""
+        """Validate the deployment environment (checked once per DeploymentManager)"""
+        if self._env_ok is None:
+            self._env_ok = self._do_validate_environment()
+        return self._env_ok
+    
+    def _do_validate_environment(self) -> bool:
+        """Run the environment checks"""
         self.logger.log("Validating deployment environment...")
         
         # Check if we're on Windows and warn about requirements
@@ -257,9 +677,7 @@ class DeploymentManager:
             self.logger.warning("Windows detected - ensure you have proper permissions and tools")
         
         # Check for Git availability
-        try:
-            subprocess.run(['git', '--version'], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if not self.git_available:
             self.logger.warning("Git not found - git integration will be disabled")
         
         self.logger.success("Environment validation passed")
@@ -268,8 +686,8 @@ class DeploymentManager:
     def prompt_for_splunk_home(self) -> Path:
         """Prompt user for Splunk home directory"""
         self.logger.bold("=== Splunk Home Detection ===")
-        print(f"Detected OS: {Colors.CYAN}{self.os_config.os_type}{Colors.NC}")
-        print(f"Default Splunk home for {self.os_config.os_type}: {Colors.YELLOW}{self.os_config.default_splunk_home}{Colors.NC}")
+        print(f"Detected OS: {CYAN}{self.os_config.os_type}{NC}")
+        print(f"Default Splunk home for {self.os_config.os_type}: {YELLOW}{self.os_config.default_splunk_home}{NC}")
         print()
         
         splunk_input = input("Enter Splunk home path (or press Enter for default): ").strip()
@@ -288,7 +706,7 @@ class DeploymentManager:
     
     def select_apps_interactive(self) -> List[str]:
         """Interactive app selection"""
-        available_apps = self.app_manager.list_available_apps()
+        available_apps = [app_name for app_name, _ in self.app_manager.list_available_apps()]
         
         if not available_apps:
             self.logger.error(f"No apps found in {self.apps_source_dir}")
@@ -297,12 +715,18 @@ class DeploymentManager:
         self.logger.bold("=== Available Apps for Deployment ===")
         print()
         
-        for i, app_name in enumerate(available_apps, 1):
-            current_version = self.app_manager.get_current_version(app_name)
-            print(f"  {Colors.CYAN}{i:2d}){Colors.NC} {app_name:<25} {Colors.YELLOW}(v{current_version}){Colors.NC}")
+        # Reading each app.conf is mostly waiting on the disk, so overlap the reads;
+        # get_current_version memoizes, so later lookups in this run are free
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(16, len(available_apps))) as pool:
+            versions = list(pool.map(self.app_manager.get_current_version, available_apps))
         
-        print()
-        selection = input(f"{Colors.BOLD}Enter app numbers to deploy (space-separated, or 'all'):{Colors.NC} ").strip()
+        lines = [_APP_MENU_TMPL.format(num=i, app=app_name, v=version) + "\n"
+                 for i, (app_name, version) in enumerate(zip(available_apps, versions), 1)]
+        lines.append("\n")
+        sys.stdout.writelines(lines)
+        sys.stdout.flush()
+        selection = input(f"{BOLD}Enter app numbers to deploy (space-separated, or 'all'):{NC} ").strip()
         
         if not selection:
             self.logger.warning("No input received. Please enter a valid selection.")
@@ -320,17 +744,20 @@ class DeploymentManager:
             selected_apps = available_apps
             self.logger.info("Selected all apps for deployment")
         else:
-            for num_str in selection.split():
-                try:
-                    num = int(num_str)
-                    if 1 <= num <= len(available_apps):
-                        app_name = available_apps[num - 1]
-                        selected_apps.append(app_name)
-                        self.logger.info(f"Selected app: {app_name}")
-                    else:
-                        self.logger.warning(f"Invalid selection: {num} (skipping)")
-                except ValueError:
-                    self.logger.warning(f"Invalid selection: {num_str} (skipping)")
+            # Keep the order the apps were entered in, selecting each one once
+            seen = set()
+            for token in selection.split():
+                if not _SELECTION_NUM_RE.fullmatch(token):
+                    self.logger.warning(f"Invalid selection: {token} (skipping)")
+                    continue
+                num = int(token)
+                if not 1 <= num <= len(available_apps):
+                    self.logger.warning(f"Invalid selection: {num} (skipping)")
+                elif num not in seen:
+                    seen.add(num)
+                    app_name = available_apps[num - 1]
+                    selected_apps.append(app_name)
+                    self.logger.info(f"Selected app: {app_name}")
         
         if not selected_apps:
             self.logger.error("No valid apps selected. Please run the script again and make a valid selection.")
@@ -347,7 +774,7 @@ class DeploymentManager:
         """Prompt for new version"""
         print()
         self.logger.bold(f"=== Version Configuration for {app_name} ===")
-        print(f"Current version: {Colors.YELLOW}{current_version}{Colors.NC}")
+        print(f"Current version: {YELLOW}{current_version}{NC}")
         print()
         
         new_version = input("Enter new version (or press Enter to keep current): ").strip()
@@ -356,28 +783,57 @@ class DeploymentManager:
             return current_version
         
         # Basic version validation
-        if re.match(r'^\d+\.\d+\.\d+$', new_version):
+        if _SEMVER_RE.match(new_version):
             return new_version
         else:
             self.logger.warning(f"Invalid version format. Using current version: {current_version}")
             return current_version
     
-    def backup_existing_app(self, app_name: str, splunk_apps_dir: Path) -> bool:
+    def backup_existing_app(self, app_name: str, splunk_apps_dir: Union[str, Path]) -> bool:
         """Backup existing app if it exists"""
-        app_path = splunk_apps_dir / app_name
+        import tarfile
         
-        if not app_path.exists():
+        app_path = os.path.join(os.fspath(splunk_apps_dir), app_name)
+        
+        if not os.path.exists(app_path):
             self.logger.log(f"No existing {app_name} app found to backup")
             return True
         
+        # A re-deploy of an unchanged app would only archive a copy of the source
+        try:
+            source_fingerprint = _tree_fingerprint(self.app_manager.get_app_path(app_name), self.copy_ignore)
+            unchanged = _tree_fingerprint(app_path) == source_fingerprint
+        except OSError:
+            unchanged = False
+        if unchanged:
+            self.logger.info(f"Installed {app_name} app is identical to the source (no-op), skipping backup")
+            return True
+        
         self.logger.log(f"Backing up existing {app_name} app...")
         
         try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            backup_path = self.backup_dir / f"{app_name}_backup_{timestamp}.tar.gz"
+            backup_name = f"{app_name}_backup_{timestamp}"
+            
+            # Only on request, snapshot the app as hard links, which copies no data but
+            # shares every file with the installed app; tar is the fallback across filesystems
+            if self.link_backups and not self.compress_backups and self.os_config.os_type != 'Windows':
+                backup_path = self.backup_dir / backup_name
+                if self._hardlink_backup(app_path, backup_path):
+                    self.logger.success(f"Backup created: {backup_path}")
+                    return True
             
-            with tarfile.open(backup_path, 'w:gz') as tar:
-                tar.add(app_path, arcname=app_name)
+            if self.compress_backups:
+                backup_path = self.backup_dir / f"{backup_name}.tar.gz"
+                mode, options = 'w:gz', {'compresslevel': 1}
+            else:
+                backup_path = self.backup_dir / f"{backup_name}.tar"
+                mode, options = 'w', {}
+            
+            with open(backup_path, 'wb', buffering=_BACKUP_BUFSIZE) as f:
+                with tarfile.open(fileobj=f, mode=mode, **options) as tar:
+                    tar.copybufsize = _BACKUP_BUFSIZE
+                    tar.add(app_path, arcname=app_name, recursive=True)
             
             self.logger.success(f"Backup created: {backup_path}")
             return True
@@ -386,87 +842,135 @@ class DeploymentManager:
             self.logger.error(f"Failed to create backup: {e}")
             return False
     
-    def deploy_app(self, app_name: str, target_dir: Path, version: str) -> bool:
-        """Deploy a single app"""
-        source_dir = self.apps_source_dir / app_name
+    def _hardlink_backup(self, app_path: str, backup_path: Path) -> bool:
+        """Snapshot an app as a tree of hard links, returning False if that is not possible"""
+        try:
+            shutil.copytree(app_path, str(backup_path), copy_function=os.link)
+            return True
+        except (OSError, shutil.Error):
+            # Typically the backup directory is on another filesystem (EXDEV)
+            shutil.rmtree(str(backup_path), ignore_errors=True)
+            return False
+    
+    def deploy_app(self, app_name: str, target_dir: Union[str, Path], version: str) -> Optional[Dict]:
+        """Deploy a single app, returning a record of what was written (None on failure)"""
+        source_dir = self.app_manager.get_app_path(app_name)
+        target_dir = os.fspath(target_dir)
+        apps_dir = os.path.dirname(target_dir)
         
         self.logger.log(f"Deploying {app_name} app (v{version})...")
         
         # Validate source app structure
         if not self.app_manager.validate_app_structure(app_name):
             self.logger.error(f"App structure validation failed for {app_name}")
-            return False
-        
-        # Backup existing app
-        if not self.backup_existing_app(app_name, target_dir.parent):
-            self.logger.error(f"Backup failed for {app_name}")
-            return False
+            return None
         
-        # Update version in source before copying
+        # Update version in source before the backup fingerprints it and it is copied
         if not self.app_manager.update_app_version(app_name, version):
             self.logger.error(f"Version update failed for {app_name}")
-            return False
+            return None
+        
+        # Backup existing app
+        if not self.backup_existing_app(app_name, apps_dir):
+            self.logger.error(f"Backup failed for {app_name}")
+            return None
         
         try:
             # Remove existing app if it exists
-            if target_dir.exists():
+            if os.path.exists(target_dir):
                 self.logger.log(f"Removing existing {app_name} app...")
                 shutil.rmtree(target_dir)
             
-            # Copy new app
-            self.logger.log(f"Copying {app_name} app to Splunk...")
-            shutil.copytree(source_dir, target_dir)
+            # Hard links only work within one filesystem, so check once up front
+            hardlink = self.hardlink
+            if hardlink and os.stat(source_dir).st_dev != os.stat(apps_dir).st_dev:
+                self.logger.warning(f"{app_name} source and target are on different filesystems, copying instead of hard-linking")
+                hardlink = False
             
-            # Set proper permissions (skip on Windows)
-            if self.os_config.os_type != 'Windows':
-                self.logger.log(f"Setting permissions for {app_name} app...")
-                self._set_app_permissions(target_dir)
+            # Copy new app, setting permissions as it is written (skip on Windows)
+            if hardlink:
+                self.logger.log(f"Hard-linking {app_name} app into Splunk...")
             else:
+                self.logger.log(f"Copying {app_name} app to Splunk...")
+            set_permissions = self.os_config.os_type != 'Windows'
+            if not set_permissions:
                 self.logger.log("Skipping permission setting on Windows")
+            copied = set()
+            if self.remote_target:
+                # Each file costs a few round trips on NFS/SMB, so keep several in flight
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=_REMOTE_COPY_WORKERS) as pool:
+                    _fast_copytree(source_dir, target_dir, set_permissions, hardlink, self.copy_ignore, copied, pool)
+            else:
+                _fast_copytree(source_dir, target_dir, set_permissions, hardlink, self.copy_ignore, copied)
             
             self.logger.success(f"{app_name} app deployed successfully")
-            return True
+            return {
+                'files': copied,
+                'has_app_conf': os.path.join(target_dir, 'default', 'app.conf') in copied,
+                'has_meta': os.path.join(target_dir, 'metadata', 'default.meta') in copied,
+            }
             
         except Exception as e:
             self.logger.error(f"Failed to deploy {app_name}: {e}")
-            return False
-    
-    def _set_app_permissions(self, app_dir: Path):
-        """Set proper permissions for the app"""
-        try:
-            # Set directory permissions
-            for root, dirs, files in os.walk(app_dir):
-                for d in dirs:
-                    os.chmod(os.path.join(root, d), 0o755)
-                for f in files:
-                    file_path = os.path.join(root, f)
-                    if file_path.endswith(('.py', '.sh')):
-                        os.chmod(file_path, 0o755)
-                    else:
-                        os.chmod(file_path, 0o644)
-        except Exception as e:
-            self.logger.warning(f"Failed to set some permissions: {e}")
+            return None
     
-    def validate_deployment(self, app_name: str, target_dir: Path) -> bool:
-        """Validate that deployment was successful"""
+    def validate_deployment(self, app_name: str, target_dir: Union[str, Path],
+                            deploy_info: Optional[Dict] = None) -> bool:
+        """Validate that deployment was successful
+        
+        deploy_info is the record returned by deploy_app; when given it is
+        trusted instead of checking the target directory again.
+        """
         self.logger.log(f"Validating {app_name} deployment...")
+        target_dir = os.fspath(target_dir)
+        key_files = [('has_app_conf', os.path.join(target_dir, 'default', 'app.conf')),
+                     ('has_meta', os.path.join(target_dir, 'metadata', 'default.meta'))]
+        
+        if deploy_info is not None:
+            for key, file_path in key_files:
+                if not deploy_info[key]:
+                    self.logger.error(f"Key file missing: {file_path}")
+                    return False
+            self.logger.success(f"{app_name} deployment validation passed")
+            return True
         
-        if not target_dir.exists():
+        if not os.path.exists(target_dir):
             self.logger.error(f"{app_name} app not found at target location")
             return False
         
         # Check key files
-        key_files = ['default/app.conf', 'metadata/default.meta']
-        for file_path in key_files:
-            if not (target_dir / file_path).exists():
-                self.logger.error(f"Key file missing: {target_dir / file_path}")
+        for _, file_path in key_files:
+            if not os.path.exists(file_path):
+                self.logger.error(f"Key file missing: {file_path}")
                 return False
         
         self.logger.success(f"{app_name} deployment validation passed")
         return True
     
+    def _prefetch_sources(self, app_names: List[str]):
+        """Pre-read the source files of the given apps (runs on a background thread)"""
+        for app_name in app_names:
+            _prefetch_tree(self.app_manager.get_app_path(app_name), self.copy_ignore)
+    
+    def _deploy_and_validate(self, app_name: str, target_dir: str, version: str) -> Tuple[bool, str, str]:
+        """Deploy and validate a single app (runs on a worker thread)"""
+        deploy_info = self.deploy_app(app_name, target_dir, version)
+        if deploy_info is None:
+            self.logger.error(f"{app_name} deployment failed")
+            return False, app_name, version
+        
+        if not self.validate_deployment(app_name, target_dir, deploy_info):
+            self.logger.error(f"{app_name} deployment validation failed")
+            return False, app_name, version
+        
+        self.logger.success(f"{app_name} v{version} deployed and validated")
+        return True, app_name, version
+    
     def restart_splunk(self, splunk_home: Path) -> bool:
         """Restart Splunk service"""
+        import subprocess
+        
         if not splunk_home or not splunk_home.exists():
             self.logger.warning("Splunk home not specified or invalid, skipping restart")
             return False
@@ -489,8 +993,9 @@ class DeploymentManager:
             
             self.logger.log(f"Using Splunk executable: {splunk_bin}")
             
-            result = subprocess.run([str(splunk_bin), 'restart'], 
-                                  capture_output=True, text=True, timeout=300)
+            # Only stderr is reported, so don't pipe and buffer stdout
+            result = subprocess.run([str(splunk_bin), 'restart'], stdout=subprocess.DEVNULL,
+                                  stderr=subprocess.PIPE, text=True, timeout=300)
             
             if result.returncode == 0:
                 self.logger.success("Splunk restarted successfully")
@@ -512,48 +1017,57 @@ class DeploymentManager:
         self.logger.bold("=== Splunk Restart Required ===")
         
         # Explain why restart is needed based on Splunk documentation
-        print(f"{Colors.CYAN}📚 Why does Splunk need to restart?{Colors.NC}")
-        print()
-        print("According to Splunk documentation:")
-        print(f"  • {Colors.YELLOW}New apps{Colors.NC} must be recognized by splunkd during startup")
-        print(f"  • {Colors.YELLOW}Configuration changes{Colors.NC} (app.conf, props.conf, etc.) require restart")
-        print(f"  • {Colors.YELLOW}Knowledge objects{Colors.NC} (dashboards, saved searches) need reloading")
-        print(f"  • {Colors.YELLOW}Search-time configuration{Colors.NC} changes take effect after restart")
-        print()
+        lines = [
+            f"{CYAN}📚 Why does Splunk need to restart?{NC}",
+            "",
+            "According to Splunk documentation:",
+            f"  • {YELLOW}New apps{NC} must be recognized by splunkd during startup",
+            f"  • {YELLOW}Configuration changes{NC} (app.conf, props.conf, etc.) require restart",
+            f"  • {YELLOW}Knowledge objects{NC} (dashboards, saved searches) need reloading",
+            f"  • {YELLOW}Search-time configuration{NC} changes take effect after restart",
+            "",
+        ]
         
         # Show what was deployed
-        print(f"{Colors.CYAN}📦 Apps deployed in this session:{Colors.NC}")
-        for app in deployed_apps:
-            print(f"  • {Colors.GREEN}{app}{Colors.NC}")
-        print()
+        lines.append(f"{CYAN}📦 Apps deployed in this session:{NC}")
+        lines.extend(f"  • {GREEN}{app}{NC}" for app in deployed_apps)
+        lines.append("")
         
         # Show restart impact
-        print(f"{Colors.CYAN}⚠️  Restart impact:{Colors.NC}")
-        print(f"  • {Colors.YELLOW}Brief service interruption{Colors.NC} (typically 30s-2min)")
-        print(f"  • {Colors.YELLOW}Active searches{Colors.NC} will be interrupted")
-        print(f"  • {Colors.YELLOW}Users logged out{Colors.NC} of Splunk Web")
-        print(f"  • {Colors.YELLOW}Scheduled searches{Colors.NC} may be delayed")
-        print()
+        lines += [
+            f"{CYAN}⚠️  Restart impact:{NC}",
+            f"  • {YELLOW}Brief service interruption{NC} (typically 30s-2min)",
+            f"  • {YELLOW}Active searches{NC} will be interrupted",
+            f"  • {YELLOW}Users logged out{NC} of Splunk Web",
+            f"  • {YELLOW}Scheduled searches{NC} may be delayed",
+            "",
+        ]
         
         # Show manual restart options
-        print(f"{Colors.CYAN}🔧 Manual restart options:{Colors.NC}")
+        lines.append(f"{CYAN}🔧 Manual restart options:{NC}")
         if self.os_config.os_type == 'Windows':
-            print(f"  • {Colors.BLUE}Command line:{Colors.NC} \"{splunk_home}\\bin\\{self.os_config.splunk_executable}\" restart")
-            print(f"  • {Colors.BLUE}Services:{Colors.NC} Restart 'Splunkd' service from Services panel")
+            lines.append(f"  • {BLUE}Command line:{NC} \"{splunk_home}\\bin\\{self.os_config.splunk_executable}\" restart")
+            lines.append(f"  • {BLUE}Services:{NC} Restart 'Splunkd' service from Services panel")
         else:
-            print(f"  • {Colors.BLUE}Command line:{Colors.NC} {splunk_home}/bin/{self.os_config.splunk_executable} restart")
+            lines.append(f"  • {BLUE}Command line:{NC} {splunk_home}/bin/{self.os_config.splunk_executable} restart")
             if self.os_config.os_type == 'Linux':
-                print(f"  • {Colors.BLUE}Systemd:{Colors.NC} sudo systemctl restart splunk")
+                lines.append(f"  • {BLUE}Systemd:{NC} sudo systemctl restart splunk")
             elif self.os_config.os_type == 'macOS':
-                print(f"  • {Colors.BLUE}Launchd:{Colors.NC} sudo launchctl restart com.splunk.splunkd")
-        print()
+                lines.append(f"  • {BLUE}Launchd:{NC} sudo launchctl restart com.splunk.splunkd")
+        lines.append("")
         
         # Interactive prompt
-        print(f"{Colors.BOLD}Would you like to restart Splunk now?{Colors.NC}")
-        print("  y/yes = Restart now (recommended)")
-        print("  n/no  = Skip restart (manual restart required)")
-        print("  i/info = Show more information about restart process")
-        print()
+        lines += [
+            f"{BOLD}Would you like to restart Splunk now?{NC}",
+            "  y/yes = Restart now (recommended)",
+            "  n/no  = Skip restart (manual restart required)",
+            "  i/info = Show more information about restart process",
+            "",
+        ]
+        
+        # Emit the whole block with a single write
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         
         while True:
             choice = input("Choose [y/n/i]: ").strip().lower()
@@ -575,62 +1089,60 @@ class DeploymentManager:
             elif choice in ['i', 'info']:
                 self._show_restart_info()
             else:
-                print(f"{Colors.YELLOW}⚠️  Please enter 'y' (yes), 'n' (no), or 'i' (info){Colors.NC}")
+                print(f"{YELLOW}⚠️  Please enter 'y' (yes), 'n' (no), or 'i' (info){NC}")
     
     def _show_restart_info(self):
         """Show detailed restart information"""
         print()
         self.logger.bold("=== Detailed Restart Information ===")
-        print()
         
-        print(f"{Colors.CYAN}📖 Splunk Documentation References:{Colors.NC}")
-        print("  • 'Deploy an app in a single-instance deployment'")
-        print("    - Apps must be restarted to be recognized by Splunk")
-        print("  • 'Configuration file precedence'")
-        print("    - Configuration changes require restart to take effect")
-        print("  • 'About configuration files'")
-        print("    - Search-time and index-time configurations need restart")
-        print()
-        
-        print(f"{Colors.CYAN}🔄 What happens during restart:{Colors.NC}")
-        print("  1. Splunkd service stops gracefully")
-        print("  2. Configuration files are re-read")
-        print("  3. Apps are discovered and loaded")
-        print("  4. Knowledge objects are indexed")
-        print("  5. Search processors are initialized")
-        print("  6. Web server starts")
-        print("  7. Services become available")
-        print()
-        
-        print(f"{Colors.CYAN}⏱️  Typical restart timeline:{Colors.NC}")
-        print("  • Small instance (1-5 apps): 30-60 seconds")
-        print("  • Medium instance (10-50 apps): 1-2 minutes")
-        print("  • Large instance (100+ apps): 2-5 minutes")
-        print("  • Depends on: hardware, app complexity, data volume")
-        print()
-        
-        print(f"{Colors.CYAN}✅ How to verify successful restart:{Colors.NC}")
-        print("  1. Check Splunk Web loads without errors")
-        print("  2. Verify new apps appear in 'Manage Apps'")
-        print("  3. Test app functionality (dashboards, searches)")
-        print("  4. Check splunkd.log for any errors")
-        print("  5. Verify all expected services are running")
-        print()
-        
-        print(f"{Colors.CYAN}🚨 When NOT to restart immediately:{Colors.NC}")
-        print("  • During business hours (active users)")
-        print("  • When critical searches are running")
-        print("  • Before testing configuration changes")
-        print("  • When deploying multiple apps (restart once at end)")
-        print("  • In production without change window")
-        print()
+        info = f"""
+{CYAN}📖 Splunk Documentation References:{NC}
+  • 'Deploy an app in a single-instance deployment'
+    - Apps must be restarted to be recognized by Splunk
+  • 'Configuration file precedence'
+    - Configuration changes require restart to take effect
+  • 'About configuration files'
+    - Search-time and index-time configurations need restart
+
+{CYAN}🔄 What happens during restart:{NC}
+  1. Splunkd service stops gracefully
+  2. Configuration files are re-read
+  3. Apps are discovered and loaded
+  4. Knowledge objects are indexed
+  5. Search processors are initialized
+  6. Web server starts
+  7. Services become available
+
+{CYAN}⏱️  Typical restart timeline:{NC}
+  • Small instance (1-5 apps): 30-60 seconds
+  • Medium instance (10-50 apps): 1-2 minutes
+  • Large instance (100+ apps): 2-5 minutes
+  • Depends on: hardware, app complexity, data volume
+
+{CYAN}✅ How to verify successful restart:{NC}
+  1. Check Splunk Web loads without errors
+  2. Verify new apps appear in 'Manage Apps'
+  3. Test app functionality (dashboards, searches)
+  4. Check splunkd.log for any errors
+  5. Verify all expected services are running
+
+{CYAN}🚨 When NOT to restart immediately:{NC}
+  • During business hours (active users)
+  • When critical searches are running
+  • Before testing configuration changes
+  • When deploying multiple apps (restart once at end)
+  • In production without change window
+
+"""
+        sys.stdout.write(info)
+        sys.stdout.flush()
 
     def handle_git_operations(self, deployed_apps: List[str]) -> bool:
         """Handle git operations"""
-        try:
-            # Check if git is available
-            subprocess.run(['git', '--version'], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        import subprocess
+        
+        if not self.git_available:
             self.logger.info("Git not available - skipping git operations")
             return False
         
@@ -640,27 +1152,23 @@ class DeploymentManager:
         
         if git_commit in ['y', 'yes']:
             try:
-                # Add app directories to git
-                files_to_commit = []
-                for app in deployed_apps:
-                    files_to_commit.append(f"shcluster/apps/{app}/")
-                files_to_commit.append("tools/deployment/deploy_app_to_dev.py")
+                # The version bumps live in the source apps, so stage all of them in one call
+                git = ['git', '-C', str(self.apps_source_dir)]
+                files_to_commit = [f"{app}/" for app in deployed_apps]
                 
                 self.logger.log("Adding files to git...")
-                subprocess.run(['git', 'add'] + files_to_commit, check=True)
+                subprocess.run(git + ['add', '--'] + files_to_commit, check=True)
                 
-                # Check if there are changes to commit
-                result = subprocess.run(['git', 'diff', '--cached', '--quiet'], 
-                                      capture_output=True)
+                # A single numstat call tells us whether anything is staged and what changed
+                numstat = subprocess.check_output(git + ['diff', '--cached', '--numstat'],
+                                                  text=True).strip()
                 
-                if result.returncode != 0:  # There are changes
+                if numstat:  # There are changes
                     # Create commit message
                     app_list = ", ".join(deployed_apps)
                     
                     # Get summary of changes
-                    summary_result = subprocess.run(['git', 'diff', '--cached', '--stat'], 
-                                                  capture_output=True, text=True)
-                    summary = summary_result.stdout.strip()
+                    summary = self._format_numstat(numstat)
                     
                     commit_msg = f"""Deploy apps: {app_list}
 
@@ -669,7 +1177,7 @@ Summary of changes:
 
 Deployed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
                     
-                    subprocess.run(['git', 'commit', '-m', commit_msg], check=True)
+                    subprocess.run(git + ['commit', '-m', commit_msg], check=True)
                     self.logger.success(f"Git commit created for deployed apps: {app_list}")
                     return True
                 else:
@@ -683,6 +1191,23 @@ Deployed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
             self.logger.info("Skipping git commit")
             return False
     
+    @staticmethod
+    def _format_numstat(numstat: str) -> str:
+        """Render `git diff --numstat` output as a short per-file change summary"""
+        lines = []
+        insertions = deletions = 0
+        for line in numstat.splitlines():
+            added, deleted, path = line.split('\t', 2)
+            if added == '-':  # Binary file
+                lines.append(f" {path} | Bin")
+                continue
+            insertions += int(added)
+            deletions += int(deleted)
+            lines.append(f" {path} | +{added} -{deleted}")
+        
+        lines.append(f" {len(lines)} file(s) changed, {insertions} insertion(s)(+), {deletions} deletion(s)(-)")
+        return "\n".join(lines)
+    
     def show_deployment_summary(self, deployed_apps: List[str], app_versions: List[str], 
                               splunk_home: Path, splunk_apps_dir: Path):
         """Show deployment summary"""
@@ -695,7 +1220,7 @@ Deployed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
             print("Deployed Apps:")
             for i, app in enumerate(deployed_apps):
                 version = app_versions[i] if i < len(app_versions) else "unknown"
-                print(f"  ✅ {Colors.CYAN}{app}{Colors.NC} {Colors.YELLOW}v{version}{Colors.NC}")
+                print(f"  ✅ {CYAN}{app}{NC} {YELLOW}v{version}{NC}")
             
             print()
             print("=== Post-Deployment Instructions ===")
@@ -739,45 +1264,55 @@ Deployed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
         self.logger.log(f"Splunk apps dir: {splunk_apps_dir}")
         
         # Create splunk apps directory if it doesn't exist
-        splunk_apps_dir.mkdir(parents=True, exist_ok=True)
+        if not splunk_apps_dir.is_dir():
+            splunk_apps_dir.mkdir(parents=True, exist_ok=True)
         
         # Select apps to deploy
         selected_apps = self.select_apps_interactive()
         
         print()
         self.logger.bold("=== Selected Apps ===")
-        for app in selected_apps:
-            current_version = self.app_manager.get_current_version(app)
-            print(f"  • {Colors.CYAN}{app}{Colors.NC} {Colors.YELLOW}(v{current_version}){Colors.NC}")
-        
-        print()
+        versions = {app: self.app_manager.get_current_version(app) for app in selected_apps}
+        # One bulk write instead of a print() per app
+        lines = [_APP_LINE_TMPL.format(app=app, v=versions[app]) + "\n" for app in selected_apps]
+        lines.append("\n")
+        sys.stdout.writelines(lines)
+        sys.stdout.flush()
         proceed = input("Proceed with deployment? (y/n): ").strip().lower()
         
         if proceed not in ['y', 'yes']:
             self.logger.info("Deployment cancelled")
             return
         
-        # Deploy each selected app
-        deployed_apps = []
-        app_versions = []
+        # Warm the page cache with the app sources while the user answers the version prompts
+        if _USE_FADVISE:
+            threading.Thread(target=self._prefetch_sources, args=(selected_apps,), daemon=True).start()
         
+        # Collect every version up front so the deployments can run unattended
+        apps_dir_s = os.fspath(splunk_apps_dir)
+        plan = []
         for app in selected_apps:
-            current_version = self.app_manager.get_current_version(app)
-            new_version = self.prompt_for_version(app, current_version)
-            
-            target_dir = splunk_apps_dir / app
-            
-            if self.deploy_app(app, target_dir, new_version):
-                if self.validate_deployment(app, target_dir):
-                    deployed_apps.append(app)
-                    app_versions.append(new_version)
-                    self.logger.success(f"{app} v{new_version} deployed and validated")
-                else:
-                    self.logger.error(f"{app} deployment validation failed")
-            else:
-                self.logger.error(f"{app} deployment failed")
-            
-            print()
+            new_version = self.prompt_for_version(app, versions[app])
+            plan.append((app, os.path.join(apps_dir_s, app), new_version))
+        
+        print()
+        
+        # Backup, copy and validation are I/O bound, so deploy the apps concurrently
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        deployed = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(plan))) as executor:
+            futures = [executor.submit(self._deploy_and_validate, app, target_dir, new_version)
+                       for app, target_dir, new_version in plan]
+            for future in as_completed(futures):
+                ok, app, new_version = future.result()
+                if ok:
+                    deployed[app] = new_version
+        
+        # Report in selection order rather than completion order
+        deployed_apps = [app for app, _, _ in plan if app in deployed]
+        app_versions = [deployed[app] for app in deployed_apps]
+        
+        print()
         
         # Restart Splunk if requested
         if restart:
@@ -793,24 +1328,30 @@ Deployed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
         self.show_deployment_summary(deployed_apps, app_versions, splunk_home, splunk_apps_dir)
 
 
-def show_help():
-    """Show help information"""
-    help_text = f"""
-{Colors.BOLD}Splunk App Deployer{Colors.NC}
+# Built once at import, after the color codes are settled
+_HELP_TEXT = f"""
+{BOLD}Splunk App Deployer{NC}
 
 This script allows you to deploy one or more Splunk apps with interactive guidance and validation.
 
-{Colors.BOLD}Usage:{Colors.NC}
+{BOLD}Usage:{NC}
   python3 splunk_app_deployer.py [OPTIONS]
 
-{Colors.BOLD}Options:{Colors.NC}
+{BOLD}Options:{NC}
   --splunk-home PATH      Path to Splunk installation directory (optional - will prompt)
   --splunk-apps-dir PATH  Target apps directory (default: SPLUNK_HOME/etc/apps)
   --apps-source-dir PATH  Source directory containing apps to deploy (default: ./apps)
   --restart              Automatically restart Splunk after deployment (skips interactive prompt)
+  --compress-backups     Write backups as .tar.gz (default: plain .tar)
+  --link-backups         Back up apps as hard-link snapshots instead of .tar (same filesystem only;
+                         the snapshot shares its files with the installed app, so in-place edits change it too)
+  --hardlink             Hard-link app files into Splunk instead of copying them (same filesystem only;
+                         linked files share contents and permissions with the source tree)
+  --include-docs         Also deploy docs, tests, VCS and build files (*.md, test/, .git/, __pycache__/, ...)
+  --remote-target        Copy several files at once per app, for apps directories on NFS/SMB mounts
   --help, -h             Show this help message
 
-{Colors.BOLD}Features:{Colors.NC}
+{BOLD}Features:{NC}
   • Cross-platform support (Linux, macOS, Windows)
   • OS-specific path detection and defaults
   • Interactive app selection from available apps
@@ -820,42 +1361,92 @@ This script allows you to deploy one or more Splunk apps with interactive guidan
   • Git integration with commit prompting
   • Comprehensive logging
 
-{Colors.BOLD}Examples:{Colors.NC}
+{BOLD}Examples:{NC}
   python3 deploy_app_to_dev.py                                    # Full interactive mode
   python3 deploy_app_to_dev.py --splunk-home /opt/splunk         # Linux/macOS with custom path
   python3 deploy_app_to_dev.py --restart                         # Interactive with auto-restart
   python3 deploy_app_to_dev.py --splunk-home "C:\\Program Files\\Splunk" --restart  # Windows, fully automated
+
 """
-    print(help_text)
+
+
+def show_help():
+    """Show help information"""
+    sys.stdout.write(_HELP_TEXT)
+
+
+# Command line options taking a path, and boolean flags (option -> argument name)
+_PATH_OPTIONS = {
+    '--splunk-home': 'splunk_home',
+    '--splunk-apps-dir': 'splunk_apps_dir',
+    '--apps-source-dir': 'apps_source_dir',
+}
+_FLAG_OPTIONS = {
+    '--restart': 'restart',
+    '--compress-backups': 'compress_backups',
+    '--link-backups': 'link_backups',
+    '--hardlink': 'hardlink',
+    '--include-docs': 'include_docs',
+    '--remote-target': 'remote_target',
+    '--help': 'help',
+    '-h': 'help',
+}
+
+
+def parse_args(argv: List[str]) -> Dict:
+    """Parse command line options (--option VALUE and --option=VALUE are both accepted)"""
+    args = dict.fromkeys(_PATH_OPTIONS.values())
+    args.update(dict.fromkeys(_FLAG_OPTIONS.values(), False))
+    
+    def fail(message: str):
+        sys.stderr.write(f"{os.path.basename(sys.argv[0])}: error: {message}\n"
+                         f"Run with --help to see the available options\n")
+        sys.exit(2)
+    
+    remaining = iter(argv)
+    for arg in remaining:
+        option, has_value, value = arg.partition('=') if arg.startswith('--') else (arg, '', '')
+        if option in _PATH_OPTIONS:
+            if not has_value:
+                value = next(remaining, None)
+                if value is None or value.startswith('-'):
+                    fail(f"argument {option}: expected one argument")
+            args[_PATH_OPTIONS[option]] = Path(value)
+        elif option in _FLAG_OPTIONS and not has_value:
+            args[_FLAG_OPTIONS[option]] = True
+        else:
+            fail(f"unrecognized arguments: {arg}")
+    
+    return args
 
 
 def main():
     """Main entry point"""
-    parser = argparse.ArgumentParser(description='Deploy Splunk apps', add_help=False)
-    parser.add_argument('--splunk-home', type=Path, help='Splunk installation directory')
-    parser.add_argument('--splunk-apps-dir', type=Path, help='Splunk apps directory')
-    parser.add_argument('--apps-source-dir', type=Path, help='Source directory containing apps to deploy')
-    parser.add_argument('--restart', action='store_true', help='Restart Splunk after deployment')
-    parser.add_argument('--help', '-h', action='store_true', help='Show help')
-    
-    args = parser.parse_args()
+    args = parse_args(sys.argv[1:])
     
-    if args.help:
+    if args['help']:
         show_help()
         return
     
     try:
-        deployment_manager = DeploymentManager(apps_source_dir=args.apps_source_dir)
+        deployment_manager = DeploymentManager(
+            apps_source_dir=args['apps_source_dir'],
+            compress_backups=args['compress_backups'],
+            link_backups=args['link_backups'],
+            hardlink=args['hardlink'],
+            include_docs=args['include_docs'],
+            remote_target=args['remote_target']
+        )
         deployment_manager.run(
-            splunk_home=args.splunk_home,
-            splunk_apps_dir=args.splunk_apps_dir,
-            restart=args.restart
+            splunk_home=args['splunk_home'],
+            splunk_apps_dir=args['splunk_apps_dir'],
+            restart=args['restart']
         )
     except KeyboardInterrupt:
-        print(f"\n{Colors.YELLOW}⚠️  Deployment interrupted by user{Colors.NC}")
+        print(f"\n{YELLOW}⚠️  Deployment interrupted by user{NC}")
         sys.exit(1)
     except Exception as e:
-        print(f"{Colors.RED}❌ Unexpected error: {e}{Colors.NC}")
+        print(f"{RED}❌ Unexpected error: {e}{NC}")
         sys.exit(1)
 
 